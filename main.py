@@ -5,50 +5,34 @@ import os
 import sys
 from src.plate_detector import PlateDetector
 from src.character_recognizer import CharacterRecognizer
+from src.video_indexer import index_video, save_plate_index
 from src.utils import save_processed_image
 
-def process_single_image(image_path, output_dir="output"):
+def recognize_regions(image, regions, character_recognizer, image_path, output_dir="output"):
     """
-    Process a single image for license plate recognition
+    OCR (x, y, w, h) plate regions, draw the results on the image and save
+    the processed plates. Returns True if any plate text was recognized
     """
-    # Check if image exists
-    if not os.path.exists(image_path):
-        print(f"Error: Image file '{image_path}' not found!")
-        return
-    
-    # Initialize detectors
-    plate_detector = PlateDetector()
-    character_recognizer = CharacterRecognizer()
-    
-    # Read image
-    image = cv2.imread(image_path)
-    if image is None:
-        print(f"Error: Could not read image '{image_path}'")
-        return
-    
-    print(f"Processing image: {image_path}")
-    
-    # Try contour-based detection first
-    plate_contours, edged = plate_detector.detect_plates_contour(image)
-    
-    plates_found = False
-    
-    # Process detected plates
-    for i, contour in enumerate(plate_contours):
-        plate_roi, bbox = plate_detector.extract_plate_region(image, contour)
+    # Collect the regions so they can be OCRed together
+    candidates = []
+    for i, (x, y, w, h) in enumerate(regions):
+        plate_roi = image[y:y+h, x:x+w]
         
         if plate_roi.size == 0:
             continue
-            
-        # Recognize characters
-        plate_text, processed_plate = character_recognizer.recognize_characters(plate_roi)
         
+        candidates.append((i, plate_roi, (x, y, w, h)))
+    
+    # Recognize characters
+    results = character_recognizer.recognize_batch([roi for _, roi, _ in candidates])
+    
+    plates_found = False
+    for (i, _, (x, y, w, h)), (plate_text, processed_plate) in zip(candidates, results):
         if plate_text:
             plates_found = True
             print(f"Plate {i+1}: {plate_text}")
             
             # Draw bounding box and text on original image
-            x, y, w, h = bbox
             cv2.rectangle(image, (x, y), (x + w, y + h), (0, 255, 0), 2)
             cv2.putText(image, plate_text, (x, y - 10), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2)
@@ -57,32 +41,54 @@ def process_single_image(image_path, output_dir="output"):
             plate_filename = f"plate_{os.path.basename(image_path)}_{i+1}.jpg"
             save_processed_image(processed_plate, plate_filename, output_dir)
     
-    # If no plates found with contour method, try morphological method
-    if not plates_found:
-        print("Trying morphological detection...")
-        plate_regions = plate_detector.detect_plates_morphological(image)
+    return plates_found
+
+def process_single_image(image_path, output_dir="output", ocr_workers=None, parallel_configs=False,
+                         tile_size=None, tile_workers=None, tile_overlap=None):
+    """
+    Process a single image for license plate recognition
+    """
+    # Check if image exists
+    if not os.path.exists(image_path):
+        print(f"Error: Image file '{image_path}' not found!")
+        return
+    
+    # Initialize detectors
+    plate_detector = PlateDetector()
+    
+    # Read image
+    image = cv2.imread(image_path)
+    if image is None:
+        print(f"Error: Could not read image '{image_path}'")
+        return
+    
+    print(f"Processing image: {image_path}")
+    
+    # Very large images are detected tile by tile instead of on the full frame
+    if tile_size and max(image.shape[:2]) > tile_size:
+        print(f"Using tiled detection (tile size {tile_size})...")
+        contour_regions, morphological_regions = plate_detector.detect_plates_tiled(
+            image, tile_size, tile_overlap, tile_workers)
+    else:
+        # Try contour-based detection first
+        plate_contours, edged = plate_detector.detect_plates_contour(image)
+        contour_regions = [plate_detector.extract_plate_region(image, contour)[1]
+                           for contour in plate_contours]
+        morphological_regions = None
+    
+    with CharacterRecognizer(max_workers=ocr_workers,
+                             parallel_configs=parallel_configs) as character_recognizer:
+        plates_found = recognize_regions(image, contour_regions, character_recognizer,
+                                         image_path, output_dir)
         
-        for i, (x, y, w, h) in enumerate(plate_regions):
-            plate_roi = image[y:y+h, x:x+w]
-            
-            if plate_roi.size == 0:
-                continue
-                
-            # Recognize characters
-            plate_text, processed_plate = character_recognizer.recognize_characters(plate_roi)
+        # If no plates found with contour method, try morphological method
+        if not plates_found:
+            print("Trying morphological detection...")
+            if morphological_regions is None:
+                morphological_regions = plate_detector.detect_plates_morphological(image)
             
-            if plate_text:
-                plates_found = True
-                print(f"Plate {i+1}: {plate_text}")
-                
-                # Draw bounding box and text on original image
-                cv2.rectangle(image, (x, y), (x + w, y + h), (0, 255, 0), 2)
-                cv2.putText(image, plate_text, (x, y - 10), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2)
-                
-                # Save processed plate image
-                plate_filename = f"plate_{os.path.basename(image_path)}_{i+1}.jpg"
-                save_processed_image(processed_plate, plate_filename, output_dir)
+            plates_found = recognize_regions(image, morphological_regions, character_recognizer,
+                                             image_path, output_dir)
     
     if not plates_found:
         print("No license plates detected in the image.")
@@ -92,12 +98,11 @@ def process_single_image(image_path, output_dir="output"):
     annotated_path = save_processed_image(image, annotated_filename, output_dir)
     print(f"Annotated image saved: {annotated_path}")
 
-def process_video(video_path, output_dir="output"):
+def process_video(video_path, output_dir="output", ocr_workers=None, parallel_configs=False):
     """
     Process video for real-time license plate recognition
     """
     plate_detector = PlateDetector()
-    character_recognizer = CharacterRecognizer()
     
     cap = cv2.VideoCapture(video_path if video_path != "webcam" else 0)
     
@@ -107,52 +112,118 @@ def process_video(video_path, output_dir="output"):
     
     print("Press 'q' to quit, 's' to save current frame")
     
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-        
-        # Process frame
-        plate_contours, _ = plate_detector.detect_plates_contour(frame)
-        
-        for contour in plate_contours:
-            plate_roi, bbox = plate_detector.extract_plate_region(frame, contour)
+    with CharacterRecognizer(max_workers=ocr_workers,
+                             parallel_configs=parallel_configs) as character_recognizer:
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
             
-            if plate_roi.size > 0:
-                plate_text, _ = character_recognizer.recognize_characters(plate_roi)
+            # Process frame
+            plate_contours, _ = plate_detector.detect_plates_contour(frame)
+            
+            candidates = []
+            for contour in plate_contours:
+                plate_roi, bbox = plate_detector.extract_plate_region(frame, contour)
                 
+                if plate_roi.size > 0:
+                    candidates.append((plate_roi, bbox))
+            
+            results = character_recognizer.recognize_batch([roi for roi, _ in candidates])
+            
+            for (_, bbox), (plate_text, _) in zip(candidates, results):
                 if plate_text:
                     x, y, w, h = bbox
                     cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
                     cv2.putText(frame, plate_text, (x, y - 10), 
                                cv2.FONT_HERSHEY_SIMPLEX, 0.9, (0, 255, 0), 2)
-        
-        # Display frame
-        cv2.imshow('ANPR System', frame)
-        
-        # Handle key presses
-        key = cv2.waitKey(1) & 0xFF
-        if key == ord('q'):
-            break
-        elif key == ord('s'):
-            # Save current frame
-            import time
-            timestamp = int(time.time())
-            save_processed_image(frame, f"capture_{timestamp}.jpg", output_dir)
-            print(f"Frame saved: capture_{timestamp}.jpg")
+            
+            # Display frame
+            cv2.imshow('ANPR System', frame)
+            
+            # Handle key presses
+            key = cv2.waitKey(1) & 0xFF
+            if key == ord('q'):
+                break
+            elif key == ord('s'):
+                # Save current frame
+                import time
+                timestamp = int(time.time())
+                save_processed_image(frame, f"capture_{timestamp}.jpg", output_dir)
+                print(f"Frame saved: capture_{timestamp}.jpg")
     
     cap.release()
     cv2.destroyAllWindows()
 
+def process_video_index(video_path, output_dir="output", workers=None, sample_interval=1.0,
+                        segment_seconds=300):
+    """
+    Index a recorded video offline and save the plate index as CSV
+    """
+    if not os.path.exists(video_path):
+        print(f"Error: Video file '{video_path}' not found!")
+        return
+    
+    index = index_video(video_path, workers, sample_interval, segment_seconds)
+    
+    for entry in index:
+        print(f"{entry['timestamp']:10.2f}s  {entry['plate']}")
+    
+    index_filename = f"index_{os.path.splitext(os.path.basename(video_path))[0]}.csv"
+    index_path = save_plate_index(index, index_filename, output_dir)
+    print(f"{len(index)} plate detections saved: {index_path}")
+
 def main():
     parser = argparse.ArgumentParser(description='Automatic Number Plate Recognition System')
     parser.add_argument('--input', type=str, help='Input image or video path')
-    parser.add_argument('--mode', type=str, choices=['image', 'video', 'webcam'], 
+    parser.add_argument('--mode', type=str, choices=['image', 'video', 'webcam', 'index'], 
                        default='image', help='Processing mode')
     parser.add_argument('--output', type=str, default='output', help='Output directory')
+    parser.add_argument('--ocr-workers', type=int, default=None,
+                       help='Number of plate candidates to OCR concurrently (default: CPU count)')
+    parser.add_argument('--parallel-configs', action='store_true',
+                       help='Also run the Tesseract configs for each candidate concurrently')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for index mode (default: CPU count)')
+    parser.add_argument('--sample-interval', type=float, default=1.0,
+                       help='Seconds between analysed frames in index mode')
+    parser.add_argument('--segment-seconds', type=float, default=300,
+                       help='Length of each unit of work in index mode')
+    parser.add_argument('--tile-size', type=int, default=None,
+                       help='Detect on overlapping tiles of this size for images larger than it')
+    parser.add_argument('--tile-overlap', type=int, default=None,
+                       help='Tile overlap in pixels (default: the largest plate the detector accepts)')
+    parser.add_argument('--tile-workers', type=int, default=None,
+                       help='Tiles processed concurrently in tiled mode (default: min(4, CPU count))')
     
     args = parser.parse_args()
     
+    if args.ocr_workers is not None and args.ocr_workers <= 0:
+        parser.error("--ocr-workers must be a positive integer")
+    if args.workers is not None and args.workers <= 0:
+        parser.error("--workers must be a positive integer")
+    if args.sample_interval <= 0:
+        parser.error("--sample-interval must be positive")
+    if args.segment_seconds < args.sample_interval:
+        parser.error("--segment-seconds must be at least --sample-interval")
+    if args.tile_size is not None:
+        plate_detector = PlateDetector()
+        min_tile_size = plate_detector.min_tile_size()
+        min_tile_overlap = plate_detector.min_tile_overlap()
+        if args.tile_size < min_tile_size:
+            parser.error(f"--tile-size must be at least {min_tile_size}")
+        if args.tile_overlap is not None and \
+                not min_tile_overlap <= args.tile_overlap < args.tile_size:
+            parser.error(f"--tile-overlap must be at least {min_tile_overlap} "
+                         "and smaller than --tile-size")
+    if args.tile_workers is not None and args.tile_workers <= 0:
+        parser.error("--tile-workers must be a positive integer")
+    
+    # Concurrent Tesseract processes would otherwise each start one OpenMP
+    # thread per core and oversubscribe the host
+    if args.ocr_workers != 1 or args.parallel_configs:
+        os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    
     # Create output directory if it doesn't exist
     if not os.path.exists(args.output):
         os.makedirs(args.output)
@@ -161,16 +232,24 @@ def main():
         if not args.input:
             print("Please provide an input image using --input parameter")
             return
-        process_single_image(args.input, args.output)
+        process_single_image(args.input, args.output, args.ocr_workers, args.parallel_configs,
+                             args.tile_size, args.tile_workers, args.tile_overlap)
     
     elif args.mode == 'video':
         if not args.input:
             print("Please provide an input video using --input parameter")
             return
-        process_video(args.input, args.output)
+        process_video(args.input, args.output, args.ocr_workers, args.parallel_configs)
     
     elif args.mode == 'webcam':
-        process_video('webcam', args.output)
+        process_video('webcam', args.output, args.ocr_workers, args.parallel_configs)
+    
+    elif args.mode == 'index':
+        if not args.input:
+            print("Please provide an input video using --input parameter")
+            return
+        process_video_index(args.input, args.output, args.workers, args.sample_interval,
+                            args.segment_seconds)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
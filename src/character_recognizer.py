@@ -5,13 +5,28 @@ import re
 import platform
 import os
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from .utils import enhance_plate_region
 
 class CharacterRecognizer:
-    def __init__(self, tesseract_path=None):
+    def __init__(self, tesseract_path=None, max_workers=None, parallel_configs=False):
         """
         Initialize Tesseract OCR
+
+        max_workers limits how many Tesseract processes recognize_batch runs
+        at once (defaults to the CPU count). With parallel_configs, the
+        Tesseract configs for a single candidate are also run concurrently,
+        sharing the same limit. Use as a context manager, or call close(),
+        to shut the thread pool down.
         """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        
+        # Tesseract runs as an external process, so threads overlap the OCR work
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.parallel_configs = parallel_configs
+        self._executor = None
+        
         # Auto-detect Windows and set Tesseract path
         if platform.system() == "Windows":
             # Common Tesseract installation paths on Windows
@@ -83,61 +98,139 @@ class CharacterRecognizer:
         """
         Perform OCR on the plate image with multiple config attempts
         """
-        best_text = ""
-        best_confidence = 0
-        best_processed_image = plate_image
+        return self.recognize_batch([plate_image])[0]
+    
+    def recognize_batch(self, plate_images):
+        """
+        Perform OCR on several plate images concurrently.
+        Results are returned in the same order as the input images.
+        """
+        # Preprocess every candidate; failures are reported like a single OCR error
+        processed_images = []
+        for plate_image in plate_images:
+            try:
+                processed_images.append(self.preprocess_for_ocr(plate_image))
+            except Exception as e:
+                print(f"OCR Error: {e}")
+                processed_images.append(None)
         
-        try:
-            # Preprocess the image for OCR
-            processed_image = self.preprocess_for_ocr(plate_image)
-            best_processed_image = processed_image
+        valid = [i for i, processed in enumerate(processed_images) if processed is not None]
+        
+        # Flatten into one job per candidate, or per (candidate, config) pair,
+        # so the shared executor caps the total number of Tesseract processes
+        if self.parallel_configs:
+            jobs = [(i, [config]) for i in valid for config in self.tesseract_configs]
+        else:
+            jobs = [(i, self.tesseract_configs) for i in valid]
+        
+        job_results = self._map(
+            lambda job: [self._ocr_with_config(processed_images[job[0]], config)
+                         for config in job[1]],
+            jobs
+        )
+        
+        # Regroup per candidate; jobs were built in config order
+        config_results = {i: [] for i in valid}
+        for (i, _), results in zip(jobs, job_results):
+            config_results[i].extend(results)
+        
+        best_texts = {}
+        for i in valid:
+            best_text = ""
+            best_confidence = 0
             
-            # Try multiple Tesseract configurations
-            for config in self.tesseract_configs:
-                try:
-                    # Get both text and confidence data
-                    data = pytesseract.image_to_data(
-                        processed_image, 
-                        config=config,
-                        output_type=pytesseract.Output.DICT
-                    )
-                    
-                    # Calculate average confidence for non-empty words
-                    confidences = [int(conf) for conf, text in zip(data['conf'], data['text']) 
-                                 if int(conf) > 0 and text.strip()]
-                    
-                    if confidences:
-                        avg_confidence = sum(confidences) / len(confidences)
-                        text = ' '.join([text for text in data['text'] if text.strip()])
-                        
-                        # Clean the text
-                        cleaned_text = self.clean_recognized_text(text)
-                        
-                        # Update best result if confidence is higher
-                        if cleaned_text and avg_confidence > best_confidence:
-                            best_text = cleaned_text
-                            best_confidence = avg_confidence
-                            
-                except Exception as e:
-                    continue
+            # Pick the best result in config order so ties resolve the same
+            # way whether or not the configs ran concurrently
+            for cleaned_text, avg_confidence in config_results[i]:
+                if cleaned_text and avg_confidence > best_confidence:
+                    best_text = cleaned_text
+                    best_confidence = avg_confidence
             
-            # If no good results with data, try simple string method
-            if not best_text:
-                for config in self.tesseract_configs:
-                    try:
-                        text = pytesseract.image_to_string(processed_image, config=config)
-                        cleaned_text = self.clean_recognized_text(text)
-                        if cleaned_text:
-                            best_text = cleaned_text
-                            break
-                    except:
-                        continue
+            best_texts[i] = best_text
+        
+        # If no good results with data, try simple string method
+        fallback = [i for i in valid if not best_texts[i]]
+        for i, text in zip(fallback, self._map(
+                lambda i: self._ocr_string_fallback(processed_images[i]), fallback)):
+            best_texts[i] = text
+        
+        results = []
+        for i, plate_image in enumerate(plate_images):
+            if processed_images[i] is None:
+                results.append(("", plate_image))
+            else:
+                results.append((best_texts[i], processed_images[i]))
+        
+        return results
+    
+    def close(self):
+        """
+        Shut down the OCR thread pool
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _map(self, func, items):
+        """
+        Map func over items on the shared executor, preserving order
+        """
+        if self.max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        
+        return list(self._executor.map(func, items))
+    
+    def _ocr_string_fallback(self, processed_image):
+        """
+        OCR the image with image_to_string, returning the first valid text
+        """
+        for config in self.tesseract_configs:
+            try:
+                text = pytesseract.image_to_string(processed_image, config=config)
+                cleaned_text = self.clean_recognized_text(text)
+                if cleaned_text:
+                    return cleaned_text
+            except:
+                continue
+        
+        return ""
+    
+    def _ocr_with_config(self, processed_image, config):
+        """
+        OCR the image with a single config, returning (text, confidence)
+        """
+        try:
+            # Get both text and confidence data
+            data = pytesseract.image_to_data(
+                processed_image, 
+                config=config,
+                output_type=pytesseract.Output.DICT
+            )
             
-            return best_text, best_processed_image
+            # Calculate average confidence for non-empty words
+            confidences = [int(conf) for conf, text in zip(data['conf'], data['text']) 
+                         if int(conf) > 0 and text.strip()]
             
+            if confidences:
+                avg_confidence = sum(confidences) / len(confidences)
+                text = ' '.join([text for text in data['text'] if text.strip()])
+                
+                # Clean the text
+                return self.clean_recognized_text(text), avg_confidence
+                
         except Exception as e:
-            print(f"OCR Error: {e}")
-            return "", plate_image
+            pass
+        
+        return "", 0
     
     def clean_recognized_text(self, text):
         """
@@ -2,12 +2,18 @@
 import cv2
 import numpy as np
 import imutils
-from .utils import preprocess_image, save_processed_image
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from .utils import preprocess_image, save_processed_image, generate_tiles, merge_overlapping_boxes
 
 class PlateDetector:
     def __init__(self):
         self.min_plate_area = 1000  # Minimum area for plate region
         self.max_plate_area = 50000  # Maximum area for plate region
+        self.min_aspect_ratio = 2  # Typical license plate aspect ratio is between 2 and 5
+        self.max_aspect_ratio = 5
+        self.plate_padding = 5  # Padding around contour-based plate crops
         
     def detect_plates_contour(self, image):
         """
@@ -61,24 +67,120 @@ class PlateDetector:
             area = cv2.contourArea(contour)
             
             # Typical license plate aspect ratio is between 2 and 5
-            if (2 < aspect_ratio < 5) and (self.min_plate_area < area < self.max_plate_area):
+            if (self.min_aspect_ratio < aspect_ratio < self.max_aspect_ratio) and \
+                    (self.min_plate_area < area < self.max_plate_area):
                 plate_regions.append((x, y, w, h))
         
         return plate_regions
     
+    def min_tile_overlap(self):
+        """
+        Smallest tile overlap that guarantees every plate the detector accepts,
+        including its crop padding, lies fully inside at least one tile
+        """
+        max_plate_width = math.sqrt(self.max_plate_area * self.max_aspect_ratio)
+        return int(math.ceil(max_plate_width)) + 2 * self.plate_padding + 1
+    
+    def min_tile_size(self):
+        """
+        Smallest tile size accepted by detect_plates_tiled
+        """
+        return 2 * self.min_tile_overlap()
+    
+    def detect_plates_tiled(self, image, tile_size=2048, overlap=None, max_workers=None,
+                            max_candidates=10):
+        """
+        Detect license plates in very large images by running detection on
+        overlapping tiles in parallel.
+        
+        Returns (contour_boxes, morphological_boxes) in full-image coordinates,
+        kept separate so callers can OCR contour hits first and fall back to
+        morphological regions, as on the full-frame path. Boxes cut by a tile
+        seam are dropped, since the overlap guarantees the whole plate appears
+        in a neighbouring tile; duplicates across seams are merged and each list
+        is capped at max_candidates, largest first.
+        
+        overlap defaults to min_tile_overlap(). Tiles are views into the image,
+        but each worker allocates a few tile-sized buffers, so peak working
+        memory is roughly max_workers x tile_size^2 x k (k ~ 4-5 buffers).
+        max_workers defaults to min(4, CPU count) to keep that bounded.
+        """
+        if overlap is None:
+            overlap = self.min_tile_overlap()
+        if tile_size < self.min_tile_size():
+            raise ValueError(f"tile_size must be at least {self.min_tile_size()}, got {tile_size}")
+        if not self.min_tile_overlap() <= overlap < tile_size:
+            raise ValueError(f"overlap must be in [{self.min_tile_overlap()}, {tile_size}), "
+                             f"got {overlap}")
+        
+        max_workers = max_workers or min(4, os.cpu_count() or 1)
+        
+        height, width = image.shape[:2]
+        tiles = generate_tiles(width, height, tile_size, overlap)
+        
+        contour_boxes = []
+        morphological_boxes = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for found_contour, found_morphological in executor.map(
+                    lambda tile: self._detect_in_tile(image, tile), tiles):
+                contour_boxes.extend(found_contour)
+                morphological_boxes.extend(found_morphological)
+        
+        return (merge_overlapping_boxes(contour_boxes)[:max_candidates],
+                merge_overlapping_boxes(morphological_boxes)[:max_candidates])
+    
+    def _detect_in_tile(self, image, tile):
+        """
+        Run contour and morphological detection on one tile, returning
+        full-image boxes for both methods
+        """
+        tx, ty, tw, th = tile
+        tile_image = image[ty:ty+th, tx:tx+tw]
+        height, width = image.shape[:2]
+        
+        def touches_seam(box):
+            # Touching a tile edge that is not also an image edge means the
+            # plate may be truncated here
+            x, y, w, h = box
+            return ((x <= 0 and tx > 0) or (y <= 0 and ty > 0) or
+                    (x + w >= tw and tx + tw < width) or (y + h >= th and ty + th < height))
+        
+        # Contour hits get the same padding as on the full-frame path,
+        # applied in full-image coordinates
+        plate_contours, _ = self.detect_plates_contour(tile_image)
+        contour_boxes = []
+        for contour in plate_contours:
+            box = cv2.boundingRect(contour)
+            if not touches_seam(box):
+                x, y, w, h = box
+                contour_boxes.append(self.pad_box((x + tx, y + ty, w, h), image.shape))
+        
+        morphological_boxes = [(x + tx, y + ty, w, h)
+                               for x, y, w, h in self.detect_plates_morphological(tile_image)
+                               if not touches_seam((x, y, w, h))]
+        
+        return contour_boxes, morphological_boxes
+    
+    def pad_box(self, box, image_shape):
+        """
+        Pad an (x, y, w, h) box by plate_padding, clipped to the image
+        """
+        x, y, w, h = box
+        x_start = max(0, x - self.plate_padding)
+        y_start = max(0, y - self.plate_padding)
+        x_end = min(image_shape[1], x + w + self.plate_padding)
+        y_end = min(image_shape[0], y + h + self.plate_padding)
+        return (x_start, y_start, x_end - x_start, y_end - y_start)
+    
     def extract_plate_region(self, image, contour):
         """
         Extract the plate region from the image using contour
         """
         # Get the bounding rectangle of the contour
-        x, y, w, h = cv2.boundingRect(contour)
+        bbox = cv2.boundingRect(contour)
         
         # Extract the plate region with some padding
-        padding = 5
-        x_start = max(0, x - padding)
-        y_start = max(0, y - padding)
-        x_end = min(image.shape[1], x + w + padding)
-        y_end = min(image.shape[0], y + h + padding)
-        
-        plate_roi = image[y_start:y_end, x_start:x_end]
-        return plate_roi, (x_start, y_start, x_end - x_start, y_end - y_start)
\ No newline at end of file
+        x, y, w, h = self.pad_box(bbox, image.shape)
+        
+        plate_roi = image[y:y+h, x:x+w]
+        return plate_roi, (x, y, w, h)
\ No newline at end of file
@@ -40,6 +40,60 @@ def enhance_plate_region(plate_roi):
     
     return plate_roi
 
+def generate_tiles(width, height, tile_size, overlap):
+    """
+    Generate (x, y, w, h) tiles covering the image, overlapping by `overlap` pixels
+    """
+    if tile_size <= 0:
+        raise ValueError(f"tile_size must be positive, got {tile_size}")
+    if not 0 <= overlap < tile_size:
+        raise ValueError(f"overlap must be in [0, tile_size), got {overlap}")
+    
+    stride = tile_size - overlap
+    
+    def starts(length):
+        if length <= tile_size:
+            return [0]
+        positions = list(range(0, length - tile_size, stride))
+        # Make sure the last tile reaches the image edge
+        positions.append(length - tile_size)
+        return positions
+    
+    tiles = []
+    for y in starts(height):
+        for x in starts(width):
+            tiles.append((x, y, min(tile_size, width - x), min(tile_size, height - y)))
+    
+    return tiles
+
+def box_iou(box_a, box_b):
+    """
+    Intersection over union of two (x, y, w, h) boxes
+    """
+    ax, ay, aw, ah = box_a
+    bx, by, bw, bh = box_b
+    ix = max(0, min(ax + aw, bx + bw) - max(ax, bx))
+    iy = max(0, min(ay + ah, by + bh) - max(ay, by))
+    intersection = ix * iy
+    union = aw * ah + bw * bh - intersection
+    return intersection / union if union > 0 else 0.0
+
+def merge_overlapping_boxes(boxes, iou_threshold=0.5):
+    """
+    Remove duplicate (x, y, w, h) boxes, such as the same plate found in two
+    overlapping tiles. Boxes are duplicates when their IoU exceeds
+    iou_threshold, so a small box inside a much larger one is kept.
+    Returns the remaining boxes, largest first.
+    """
+    boxes = sorted(boxes, key=lambda b: b[2] * b[3], reverse=True)
+    kept = []
+    
+    for box in boxes:
+        if all(box_iou(box, other) <= iou_threshold for other in kept):
+            kept.append(box)
+    
+    return kept
+
 def save_processed_image(image, filename, output_dir="output"):
     """
     Save processed image to output directory
@@ -0,0 +1,199 @@
+#/src/video_indexer.py
+import cv2
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .plate_detector import PlateDetector
+from .character_recognizer import CharacterRecognizer
+
+def split_into_segments(total_frames, segment_length):
+    """
+    Split a frame range into contiguous (start, end) segments of segment_length
+    frames. The last segment's end is None so it reads until the video ends,
+    since the container's frame count is only an estimate.
+    """
+    segment_length = max(1, segment_length)
+
+    segments = []
+    for start in range(0, max(total_frames, 1), segment_length):
+        segments.append((start, start + segment_length))
+
+    last_start, _ = segments[-1]
+    segments[-1] = (last_start, None)
+
+    return segments
+
+def index_segment(video_path, start_frame, end_frame, frame_step, fps):
+    """
+    Detect and recognize plates in one segment of a video file.
+    Runs in a worker process, so it opens its own capture and seeks to its start.
+    An end_frame of None reads until the video ends.
+    """
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise IOError(f"Could not open video '{video_path}'")
+
+    frame_number = _seek_to_frame(cap, start_frame, fps)
+    if frame_number is None:
+        cap.release()
+        return []
+
+    plate_detector = PlateDetector()
+    # Each process already owns a core, so OCR stays single-threaded here
+    character_recognizer = CharacterRecognizer(max_workers=1)
+
+    detections = []
+
+    while end_frame is None or frame_number < end_frame:
+        # grab() advances without decoding; only sampled frames are retrieved
+        if not cap.grab():
+            break
+
+        current_frame = frame_number
+        frame_number += 1
+
+        if current_frame % frame_step != 0:
+            continue
+
+        # Use the stream timestamp rather than assuming a constant frame rate
+        position_msec = cap.get(cv2.CAP_PROP_POS_MSEC)
+        timestamp = position_msec / 1000.0 if position_msec > 0 else current_frame / fps
+
+        ret, frame = cap.retrieve()
+        if not ret:
+            continue
+
+        plate_contours, _ = plate_detector.detect_plates_contour(frame)
+
+        candidates = []
+        for contour in plate_contours:
+            plate_roi, bbox = plate_detector.extract_plate_region(frame, contour)
+
+            if plate_roi.size > 0:
+                candidates.append((plate_roi, bbox))
+
+        results = character_recognizer.recognize_batch([roi for roi, _ in candidates])
+
+        for (_, bbox), (plate_text, _) in zip(candidates, results):
+            if plate_text:
+                detections.append({
+                    'timestamp': timestamp,
+                    'frame': current_frame,
+                    'plate': plate_text,
+                    'bbox': bbox
+                })
+
+    cap.release()
+    return detections
+
+def _seek_to_frame(cap, start_frame, fps):
+    """
+    Position the capture at start_frame and return the frame number it is at,
+    or None if the video ends first. Seeking is keyframe based for many
+    codecs, so if the backend lands past the target we seek further back and
+    step forward with grab() instead of silently skipping frames.
+    """
+    for backoff_seconds in (0, 2, 10, 60):
+        target = max(0, start_frame - int(backoff_seconds * fps))
+        cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+        frame_number = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+
+        if frame_number <= start_frame or target == 0:
+            break
+
+    if frame_number > start_frame:
+        print(f"Warning: could not seek to frame {start_frame}, "
+              f"frames {start_frame}-{frame_number - 1} are not indexed")
+        return frame_number
+
+    while frame_number < start_frame:
+        if not cap.grab():
+            return None
+        frame_number += 1
+
+    return frame_number
+
+def _init_worker():
+    """
+    Limit each worker process to one thread so N workers use N cores
+    """
+    cv2.setNumThreads(1)
+    os.environ['OMP_THREAD_LIMIT'] = '1'
+
+def index_video(video_path, num_workers=None, sample_interval=1.0, segment_seconds=300):
+    """
+    Build a timestamped plate index for a video file by processing
+    fixed-length time segments in parallel worker processes.
+    sample_interval is the number of seconds between analysed frames and
+    segment_seconds the length of each unit of work.
+    """
+    if num_workers is not None and num_workers < 1:
+        raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+    if sample_interval <= 0:
+        raise ValueError(f"sample_interval must be positive, got {sample_interval}")
+    if segment_seconds < sample_interval:
+        raise ValueError("segment_seconds must be at least sample_interval, "
+                         f"got {segment_seconds} < {sample_interval}")
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        print(f"Error: Could not open video '{video_path}'")
+        return []
+
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    cap.release()
+
+    num_workers = num_workers or os.cpu_count() or 1
+    frame_step = max(1, int(round(sample_interval * fps)))
+    segment_length = max(1, int(round(segment_seconds * fps)))
+
+    # Many short segments keep all workers busy even when some parts of the
+    # recording are much busier than others
+    segments = split_into_segments(total_frames, segment_length)
+    print(f"Indexing ~{total_frames} frames in {len(segments)} segments "
+          f"on {num_workers} workers (every {frame_step} frames)")
+
+    index = []
+    failed = 0
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker) as executor:
+        futures = {
+            executor.submit(index_segment, video_path, start, end, frame_step, fps): (start, end)
+            for start, end in segments
+        }
+
+        for done, future in enumerate(as_completed(futures), 1):
+            start, end = futures[future]
+            try:
+                detections = future.result()
+                index.extend(detections)
+                print(f"Segment {done}/{len(segments)} (frame {start}): "
+                      f"{len(detections)} plates")
+            except Exception as e:
+                failed += 1
+                print(f"Segment {done}/{len(segments)} (frame {start}) failed: {e}")
+
+    if failed:
+        print(f"Warning: {failed} segments failed and are missing from the index")
+
+    # Segments finish out of order, so sort the merged index by time
+    index.sort(key=lambda entry: (entry['timestamp'], entry['frame']))
+    return index
+
+def save_plate_index(index, filename, output_dir="output"):
+    """
+    Save a plate index as CSV in the output directory
+    """
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    output_path = os.path.join(output_dir, filename)
+    with open(output_path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['timestamp', 'frame', 'plate', 'x', 'y', 'w', 'h'])
+        for entry in index:
+            x, y, w, h = entry['bbox']
+            writer.writerow([f"{entry['timestamp']:.2f}", entry['frame'],
+                             entry['plate'], x, y, w, h])
+
+    return output_path
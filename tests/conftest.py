@@ -0,0 +1,6 @@
+# tests/conftest.py
+import os
+import sys
+
+# Make the src package importable when running pytest from any directory
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,51 @@
+# tests/test_character_recognizer.py
+import time
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("pytesseract")
+
+from src.character_recognizer import CharacterRecognizer
+
+
+def make_recognizer(monkeypatch, **kwargs):
+    recognizer = CharacterRecognizer(**kwargs)
+
+    # Skip image preprocessing and fake Tesseract: later candidates finish
+    # first, and the psm 7 config always has the highest confidence
+    monkeypatch.setattr(recognizer, "preprocess_for_ocr", lambda plate: plate)
+
+    def fake_ocr(plate, config):
+        time.sleep(0.01 * (5 - int(plate[-1])))
+        psm = config.split("--psm ")[1].split()[0]
+        return f"{plate}{psm}", 90 if psm == "7" else 50
+
+    monkeypatch.setattr(recognizer, "_ocr_with_config", fake_ocr)
+    return recognizer
+
+
+@pytest.mark.parametrize("parallel_configs", [False, True])
+def test_recognize_batch_keeps_input_order(monkeypatch, parallel_configs):
+    plates = ["AB121", "CD342", "EF563", "GH784"]
+
+    with make_recognizer(monkeypatch, max_workers=4,
+                         parallel_configs=parallel_configs) as recognizer:
+        results = recognizer.recognize_batch(plates)
+
+    assert [text for text, _ in results] == [plate + "7" for plate in plates]
+    assert [processed for _, processed in results] == plates
+
+
+def test_recognize_batch_matches_serial(monkeypatch):
+    plates = ["AB121", "CD342", "EF563"]
+
+    with make_recognizer(monkeypatch, max_workers=1) as serial:
+        expected = serial.recognize_batch(plates)
+    with make_recognizer(monkeypatch, max_workers=3, parallel_configs=True) as parallel:
+        assert parallel.recognize_batch(plates) == expected
+
+
+@pytest.mark.parametrize("max_workers", [0, -2])
+def test_rejects_non_positive_workers(max_workers):
+    with pytest.raises(ValueError):
+        CharacterRecognizer(max_workers=max_workers)
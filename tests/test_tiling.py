@@ -0,0 +1,90 @@
+# tests/test_tiling.py
+import pytest
+
+pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from src.plate_detector import PlateDetector
+from src.utils import generate_tiles, merge_overlapping_boxes, box_iou
+
+
+def covered(tiles, width, height):
+    mask = np.zeros((height, width), dtype=bool)
+    for x, y, w, h in tiles:
+        mask[y:y+h, x:x+w] = True
+    return mask.all()
+
+
+def test_tiles_cover_image_and_stay_inside():
+    tiles = generate_tiles(5000, 3000, 2048, 512)
+
+    assert covered(tiles, 5000, 3000)
+    for x, y, w, h in tiles:
+        assert 0 <= x and x + w <= 5000
+        assert 0 <= y and y + h <= 3000
+        assert (w, h) == (2048, 2048)
+
+
+def test_edge_tiles_reach_image_border():
+    tiles = generate_tiles(5000, 3000, 2048, 512)
+
+    assert max(x + w for x, _, w, _ in tiles) == 5000
+    assert max(y + h for _, y, _, h in tiles) == 3000
+
+
+def test_small_image_is_a_single_tile():
+    assert generate_tiles(1000, 800, 2048, 512) == [(0, 0, 1000, 800)]
+
+
+@pytest.mark.parametrize("tile_size, overlap", [(-5, -1), (0, 0), (100, 100), (100, -1)])
+def test_invalid_tiling_is_rejected(tile_size, overlap):
+    with pytest.raises(ValueError):
+        generate_tiles(100, 100, tile_size, overlap)
+
+
+def test_seam_duplicates_are_merged():
+    boxes = [(100, 100, 300, 80), (101, 100, 299, 80), (900, 900, 200, 50)]
+
+    assert merge_overlapping_boxes(boxes) == [(100, 100, 300, 80), (900, 900, 200, 50)]
+
+
+def test_box_contained_in_larger_region_is_kept():
+    plate = (120, 110, 200, 50)
+    loose_region = (60, 60, 500, 200)
+
+    assert box_iou(plate, loose_region) < 0.5
+    assert merge_overlapping_boxes([plate, loose_region]) == [loose_region, plate]
+
+
+def test_tiled_detection_finds_seam_plate_once(monkeypatch):
+    detector = PlateDetector()
+    tile_size = detector.min_tile_size()
+    overlap = detector.min_tile_overlap()
+
+    # Place a plate across the first vertical seam
+    image = np.zeros((tile_size, 3 * tile_size, 3), dtype=np.uint8)
+    plate = (tile_size - 100, 300, 400, 100)
+    x, y, w, h = plate
+    image[y:y+h, x:x+w] = 255
+
+    def fake_morphological(tile_image):
+        ys, xs = np.nonzero(tile_image[:, :, 0])
+        if len(xs) == 0:
+            return []
+        return [(xs.min(), ys.min(), xs.max() - xs.min() + 1, ys.max() - ys.min() + 1)]
+
+    monkeypatch.setattr(detector, "detect_plates_contour", lambda tile_image: ([], None))
+    monkeypatch.setattr(detector, "detect_plates_morphological", fake_morphological)
+
+    contour_boxes, morphological_boxes = detector.detect_plates_tiled(image, tile_size, overlap)
+
+    assert contour_boxes == []
+    assert morphological_boxes == [plate]
+
+
+def test_tiled_detection_rejects_tiny_tiles():
+    detector = PlateDetector()
+    image = np.zeros((100, 100, 3), dtype=np.uint8)
+
+    with pytest.raises(ValueError):
+        detector.detect_plates_tiled(image, tile_size=1)
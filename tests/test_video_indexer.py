@@ -0,0 +1,77 @@
+# tests/test_video_indexer.py
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("pytesseract")
+
+from src.video_indexer import split_into_segments, _seek_to_frame, index_video
+
+
+class FakeCapture:
+    """
+    Minimal VideoCapture stand-in whose seeks snap to keyframes
+    """
+    def __init__(self, total_frames, keyframe_interval, overshoot=False):
+        self.total_frames = total_frames
+        self.keyframe_interval = keyframe_interval
+        self.overshoot = overshoot
+        self.position = 0
+
+    def set(self, prop, value):
+        keyframe = (value // self.keyframe_interval) * self.keyframe_interval
+        if self.overshoot and keyframe < value:
+            keyframe += self.keyframe_interval
+        self.position = keyframe
+
+    def get(self, prop):
+        return self.position
+
+    def grab(self):
+        if self.position >= self.total_frames:
+            return False
+        self.position += 1
+        return True
+
+
+def test_segments_are_contiguous_and_last_is_open():
+    segments = split_into_segments(1000, 300)
+
+    assert segments == [(0, 300), (300, 600), (600, 900), (900, None)]
+
+
+def test_single_segment_when_shorter_than_segment_length():
+    assert split_into_segments(100, 300) == [(0, None)]
+
+
+def test_unknown_frame_count_still_reads_whole_video():
+    assert split_into_segments(0, 300) == [(0, None)]
+
+
+def test_seek_steps_forward_from_earlier_keyframe():
+    cap = FakeCapture(total_frames=1000, keyframe_interval=250)
+
+    assert _seek_to_frame(cap, 300, fps=30) == 300
+    assert cap.position == 300
+
+
+def test_seek_backs_off_when_backend_overshoots():
+    cap = FakeCapture(total_frames=5000, keyframe_interval=50, overshoot=True)
+
+    assert _seek_to_frame(cap, 1020, fps=30) == 1020
+
+
+def test_seek_past_end_returns_none():
+    cap = FakeCapture(total_frames=100, keyframe_interval=250)
+
+    assert _seek_to_frame(cap, 300, fps=30) is None
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"num_workers": 0},
+    {"num_workers": -2},
+    {"sample_interval": 0},
+    {"segment_seconds": 0},
+])
+def test_index_video_rejects_invalid_arguments(kwargs):
+    with pytest.raises(ValueError):
+        index_video("missing.mp4", **kwargs)